@@ -8,10 +8,22 @@ bl_info = {
     "category": "Mesh",
 }
 
+import math
+
 import bpy
 import bmesh
-from bpy_extras import view3d_utils
-from mathutils import Vector
+import numpy as np
+from bpy.app.handlers import persistent
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Element types of the active selection, looked up once
+BMVERT = bmesh.types.BMVert
+BMFACE = bmesh.types.BMFace
 
 # ============================================================
 # View helpers
@@ -30,251 +42,600 @@ def get_view_region_rv3d(context):
     return None, None
 
 
-# ============================================================
-# Per-element walking: vertices
-# ============================================================
+def to_world(co, matrix_world):
+    """Apply matrix_world to (N, 3) float32 coords as one affine product."""
+    mw = np.asarray(matrix_world, dtype=np.float32)
+    return co @ mw[:3, :3].T + mw[:3, 3]
 
-def walk_single_vertex(v, bm, mw, region, rv3d, direction_vector):
+
+def read_selection(obj):
     """
-    Return the best neighbor vert for v in given direction,
-    using an angular cone around the gesture direction.
-    Works for both cardinal and diagonal directions.
+    Return (vert_sel, face_sel), the selection of an edit-mode mesh as
+    bool arrays. The edit BMesh is synced into obj.data first so
+    foreach_get sees it; the other readers below rely on that sync.
     """
-    aworld = mw @ v.co
-    a2d = view3d_utils.location_3d_to_region_2d(region, rv3d, aworld)
-    if a2d is None:
-        return None
+    obj.update_from_editmode()
+    me = obj.data
 
-    # Normalize the intended direction (screen space)
-    dir_vec = Vector(direction_vector)
-    if dir_vec.length == 0:
-        return None
-    dir_vec.normalize()
+    vert_sel = np.empty(len(me.vertices), dtype=bool)
+    me.vertices.foreach_get("select", vert_sel)
+    face_sel = np.empty(len(me.polygons), dtype=bool)
+    me.polygons.foreach_get("select", face_sel)
+    return vert_sel, face_sel
 
-    best = None
-    best_score = None
 
-    # Cosine of 45° ≈ 0.707
-    COS_HALF_ANGLE = 0.70710678
+def read_world_coords(obj):
+    """
+    Return the world-space vertex coords of an edit-mode mesh as (N, 3) float32.
+    obj.data must be synced with the edit BMesh (see read_selection).
+    """
+    me = obj.data
 
-    for e in v.link_edges:
-        nv = e.other_vert(v)
-        vworld = mw @ nv.co
-        v2d = view3d_utils.location_3d_to_region_2d(region, rv3d, vworld)
-        if v2d is None:
-            continue
+    co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+    me.vertices.foreach_get("co", co)
+    return to_world(co.reshape(-1, 3), obj.matrix_world)
 
-        delta = v2d - a2d
-        dist = delta.length
-        if dist == 0:
-            continue
 
-        delta_vec = Vector((delta.x, delta.y))
-        delta_vec.normalize()
+def read_face_centers(obj):
+    """
+    Return the world-space median centers of all polygons as (F, 3) float32.
+    obj.data must be synced with the edit BMesh (see read_selection).
+    """
+    me = obj.data
 
-        # Alignment with desired direction
-        dot = delta_vec.dot(dir_vec)
+    centers = np.empty(len(me.polygons) * 3, dtype=np.float32)
+    me.polygons.foreach_get("center", centers)
+    return to_world(centers.reshape(-1, 3), obj.matrix_world)
 
-        # Reject neighbors outside the 45° cone, or in opposite direction
-        if dot <= COS_HALF_ANGLE:
-            continue
 
-        # Score: better alignment & closer distance is better
-        score = dot * 10.0 - dist
+def build_csr(src, dst, count):
+    """
+    Group (src, dst) pairs by src into CSR arrays (indptr, indices):
+    the neighbors of element i are indices[indptr[i]:indptr[i + 1]].
+    """
+    order = np.argsort(src, kind='stable')
+    indices = dst[order].astype(np.int32)
+    indptr = np.zeros(count + 1, dtype=np.int32)
+    np.cumsum(np.bincount(src, minlength=count), out=indptr[1:])
+    return indptr, indices
+
+
+def vertex_adjacency(me):
+    """Return the edge-connected vertex neighbors of obj.data as CSR."""
+    edges = np.empty(len(me.edges) * 2, dtype=np.int32)
+    me.edges.foreach_get("vertices", edges)
+    a = edges[0::2]
+    b = edges[1::2]
+    return build_csr(np.r_[a, b], np.r_[b, a], len(me.vertices))
+
+
+def face_adjacency(me):
+    """Return the edge-sharing face neighbors of obj.data as CSR."""
+    face_count = len(me.polygons)
+    loop_edges = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("edge_index", loop_edges)
+    loop_total = np.empty(face_count, dtype=np.int32)
+    me.polygons.foreach_get("loop_total", loop_total)
+    loop_faces = np.repeat(np.arange(face_count, dtype=np.int64), loop_total)
+
+    # Sort loops by edge: faces sharing an edge become one contiguous run,
+    # and a run of k faces holds its pairs at offsets 1 .. k-1
+    order = np.argsort(loop_edges, kind='stable')
+    edge_sorted = loop_edges[order]
+    face_sorted = loop_faces[order]
+
+    keys = []
+    shift = 1
+    while shift < len(edge_sorted):
+        same = edge_sorted[shift:] == edge_sorted[:-shift]
+        if not same.any():
+            break
+        a = face_sorted[:-shift][same]
+        b = face_sorted[shift:][same]
+        keys.append(a * face_count + b)
+        keys.append(b * face_count + a)
+        shift += 1
+
+    # Drop duplicates (faces sharing several edges) and self pairs
+    keys = np.unique(np.concatenate(keys)) if keys else np.empty(0, np.int64)
+    src = keys // face_count
+    dst = keys % face_count
+    keep = src != dst
+    return build_csr(src[keep], dst[keep], face_count)
+
+
+def view_params(region, rv3d):
+    """
+    Return (P, width, height): the view's perspective matrix as float32
+    and the region size, read once per walk.
+    """
+    P = np.asarray(rv3d.perspective_matrix, dtype=np.float32)
+    return P, region.width, region.height
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def project_kernel(world, P, width, height, x2d, y2d, valid):
+        """Compiled per-point projection, same math as the NumPy path."""
+        for i in range(world.shape[0]):
+            px = world[i, 0]
+            py = world[i, 1]
+            pz = world[i, 2]
+            x = P[0, 0] * px + P[0, 1] * py + P[0, 2] * pz + P[0, 3]
+            y = P[1, 0] * px + P[1, 1] * py + P[1, 2] * pz + P[1, 3]
+            w = P[3, 0] * px + P[3, 1] * py + P[3, 2] * pz + P[3, 3]
+            if w > 1e-6:
+                valid[i] = True
+                x2d[i] = (x / w * 0.5 + 0.5) * width
+                y2d[i] = (y / w * 0.5 + 0.5) * height
+            else:
+                valid[i] = False
+                x2d[i] = 0.0
+                y2d[i] = 0.0
+
+
+def project_to_region(world, view):
+    """
+    Project world-space coords (N, 3) to region pixels in one batch,
+    view being view_params(region, rv3d).
+    Returns (x2d, y2d, valid); valid is False for points behind the view,
+    which are never walked from or onto. Points beside the region stay
+    valid, as with location_3d_to_region_2d.
+    Uses the Numba kernel when available, NumPy otherwise.
+    """
+    P, width, height = view
 
-        if best_score is None or score > best_score:
-            best_score = score
-            best = nv
+    if HAS_NUMBA:
+        x2d = np.empty(len(world), dtype=np.float32)
+        y2d = np.empty(len(world), dtype=np.float32)
+        valid = np.empty(len(world), dtype=bool)
+        project_kernel(world, P, width, height, x2d, y2d, valid)
+        return x2d, y2d, valid
 
-    return best
+    # Only clip x, y and w are needed: apply those rows as affine
+    # transforms, skipping the z row and the homogeneous padding
+    xy = world @ P[:2, :3].T + P[:2, 3]
+    w = world @ P[3, :3] + P[3, 3]
 
-def walk_vertices(context, direction_vector):
-    obj = context.edit_object
-    if not obj or obj.type != 'MESH':
-        return {'CANCELLED'}
+    # Only points in front of the view can be placed on screen
+    valid = w > 1e-6
+    w = np.where(valid, w, 1.0)
 
-    region, rv3d = get_view_region_rv3d(context)
-    if region is None:
-        return {'CANCELLED'}
+    x2d = (xy[:, 0] / w * 0.5 + 0.5) * width
+    y2d = (xy[:, 1] / w * 0.5 + 0.5) * height
+    return x2d, y2d, valid
 
-    me = obj.data
-    bm = bmesh.from_edit_mesh(me)
-    mw = obj.matrix_world
 
-    selected_verts = [v for v in bm.verts if v.select]
-    if not selected_verts:
-        return {'CANCELLED'}
+# ============================================================
+# Walk cache
+# ============================================================
 
-    active = bm.select_history.active
-    if not isinstance(active, bmesh.types.BMVert) or not active.select:
-        active = selected_verts[0]
+# Arrays of the previous walk, per object. Topology is kept until the
+# mesh geometry changes; world coords and projections also track the
+# object transform and the view they were computed for.
+walk_cache = {}
 
-    # First compute targets for ALL selected verts without changing selection
-    origin_set = set(selected_verts)
-    moved_origins = set()
-    target_verts = set()
-    active_target = None
-
-    for v in origin_set:
-        target = walk_single_vertex(v, bm, mw, region, rv3d, direction_vector)
-        if target:
-            target_verts.add(target)
-            moved_origins.add(v)
-            if v is active:
-                active_target = target
-
-    # Build final selection:
-    # - moved verts → replaced by their targets
-    # - non-moved verts → stay selected where they are
-    final_selection = set(origin_set - moved_origins) | target_verts
-
-    if not final_selection:
-        return {'CANCELLED'}
 
-    # Determine new active
-    if active_target:
-        new_active = active_target
-    else:
-        # If active didn't move, keep it active
-        new_active = active
+def matrix_key(matrix):
+    """Return a hashable snapshot of a mathutils Matrix."""
+    return np.asarray(matrix, dtype=np.float32).tobytes()
 
-    # Clear all selections (verts, edges, faces)
-    for v in bm.verts:
-        v.select_set(False)
-    for e in bm.edges:
-        e.select_set(False)
-    for f in bm.faces:
-        f.select_set(False)
 
-    # Apply vertex selection
-    for v in final_selection:
-        v.select_set(True)
+def walk_cache_entry(obj, bm):
+    """Return the cache entry for obj, starting afresh if its counts changed."""
+    key = obj.as_pointer()
+    counts = (len(bm.verts), len(bm.edges), len(bm.faces))
+    entry = walk_cache.get(key)
+    if entry is None or entry["counts"] != counts:
+        entry = walk_cache[key] = {
+            "counts": counts,
+            "mesh": obj.data.as_pointer(),
+            "own_update": False,
+        }
+    return entry
 
-    bm.select_history.clear()
-    new_active.select_set(True)
-    bm.select_history.add(new_active)
 
-    bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
-    return {'FINISHED'}
+def cached_world_coords(entry, obj):
+    """read_world_coords, reused while matrix_world is unchanged."""
+    mw_key = matrix_key(obj.matrix_world)
+    if entry.get("world_key") != mw_key:
+        entry["world"] = read_world_coords(obj)
+        entry["world_key"] = mw_key
+    return entry["world"]
 
 
-# ============================================================
-# Per-element walking: faces
-# ============================================================
+def cached_face_centers(entry, obj):
+    """read_face_centers, reused while matrix_world is unchanged."""
+    mw_key = matrix_key(obj.matrix_world)
+    if entry.get("centers_key") != mw_key:
+        entry["centers"] = read_face_centers(obj)
+        entry["centers_key"] = mw_key
+    return entry["centers"]
 
-def walk_single_face(f, bm, mw, region, rv3d, direction_vector):
+
+def read_walk_selection(entry, obj):
     """
-    Return the best neighbor face for f in given direction,
-    using an angular cone around the gesture direction.
-    Works for both cardinal and diagonal directions.
+    read_selection for a walk. Its sync tags obj for a geometry update,
+    which is the walk's own and must not drop entry, even when the walk
+    then cancels without changing anything.
     """
-    aworld = mw @ f.calc_center_median()
-    a2d = view3d_utils.location_3d_to_region_2d(region, rv3d, aworld)
-    if a2d is None:
-        return None
+    entry["own_update"] = True
+    return read_selection(obj)
+
+
+def view_key(obj, view):
+    """Everything a projection of obj depends on besides its geometry."""
+    P, width, height = view
+    return (matrix_key(obj.matrix_world), P.tobytes(), width, height)
+
+
+@persistent
+def walk_cache_depsgraph_update(scene, depsgraph):
+    """
+    Drop cached arrays of meshes whose geometry changed. A walk tags its
+    own mesh for a geometry update too; that one update is skipped.
+    """
+    if not walk_cache:
+        return
+    changed = {
+        update.id.original.as_pointer()
+        for update in depsgraph.updates
+        if update.is_updated_geometry
+    }
+    for key, entry in list(walk_cache.items()):
+        if key in changed or entry["mesh"] in changed:
+            if entry["own_update"]:
+                entry["own_update"] = False
+            else:
+                del walk_cache[key]
+
+
+@persistent
+def walk_cache_load_post(*_args):
+    walk_cache.clear()
+
+
+# ============================================================
+# Per-element walking: vertices
+# ============================================================
+
+# The eight gesture directions (screen space)
+GESTURE_DIRECTIONS = (
+    (1, 0), (1, 1), (0, 1), (-1, 1),
+    (-1, 0), (-1, -1), (0, -1), (1, -1),
+)
+
+# Screen angle of each gesture direction, in radians
+GESTURE_ANGLES = tuple(math.atan2(dy, dx) for dx, dy in GESTURE_DIRECTIONS)
 
-    from mathutils import Vector
 
-    dir_vec = Vector(direction_vector)
-    if dir_vec.length == 0:
+def unit_direction(direction_vector):
+    """Return the normalized (dir_x, dir_y), or None for a zero vector."""
+    dir_x, dir_y = direction_vector
+    length = (dir_x * dir_x + dir_y * dir_y) ** 0.5
+    if length == 0:
         return None
-    dir_vec.normalize()
+    return dir_x / length, dir_y / length
 
-    best = None
-    best_score = None
 
-    COS_HALF_ANGLE = 0.70710678  # ≈ cos(45°)
+def make_scorer(direction_vector):
+    """
+    Build the NumPy scorer for one gesture direction, with the normalized
+    direction folded in as constants: scorer(dx, dy) -> (mask, score).
+    Axis-aligned directions skip the zero terms entirely.
+    """
+    dir_x, dir_y = unit_direction(direction_vector)
+
+    # Along-direction (primary) and cross (secondary) components
+    if dir_y == 0.0:
+        def terms(dx, dy):
+            return dx * dir_x, np.abs(dy)
+    elif dir_x == 0.0:
+        def terms(dx, dy):
+            return dy * dir_y, np.abs(dx)
+    else:
+        def terms(dx, dy):
+            return dx * dir_x + dy * dir_y, np.abs(dx * dir_y - dy * dir_x)
+
+    def scorer(dx, dy):
+        # Reject neighbors outside the 45° cone, or in opposite direction:
+        # along-direction component must beat the cross component
+        primary, secondary = terms(dx, dy)
+        mask = primary > secondary
+
+        # Score: better alignment & closer distance is better. Only the
+        # candidates inside the cone pay for the sqrt and divide; the
+        # normalized dot is just primary / dist.
+        dx = dx[mask]
+        dy = dy[mask]
+        dist = np.sqrt(dx * dx + dy * dy)
+        score = np.full(len(mask), -np.inf, dtype=dist.dtype)
+        score[mask] = primary[mask] / dist * 10.0 - dist
+        return mask, score
+
+    return scorer
 
-    # Collect neighbors
-    neighbor_faces = set()
-    for e in f.edges:
-        for nf in e.link_faces:
-            if nf is not f:
-                neighbor_faces.add(nf)
 
-    for nf in neighbor_faces:
-        fworld = mw @ nf.calc_center_median()
-        f2d = view3d_utils.location_3d_to_region_2d(region, rv3d, fworld)
-        if f2d is None:
-            continue
+def make_kernel(direction_vector):
+    """
+    Build the Numba kernel for one gesture direction. The normalized
+    direction is a closure constant, so the compiler folds the zero and
+    unit terms of axis-aligned directions. Compiled on first call.
+    """
+    dir_x, dir_y = unit_direction(direction_vector)
+
+    @njit(cache=True, fastmath=True)
+    def kernel(sel, indptr, indices, x2d, y2d, valid, best):
+        for k in range(sel.shape[0]):
+            o = sel[k]
+            if not valid[o]:
+                continue
+            ax = x2d[o]
+            ay = y2d[o]
+
+            found = False
+            best_score = 0.0
+            for p in range(indptr[o], indptr[o + 1]):
+                j = indices[p]
+                if not valid[j]:
+                    continue
+                dx = x2d[j] - ax
+                dy = y2d[j] - ay
+                # 45° cone: along-direction component beats the cross one
+                primary = dx * dir_x + dy * dir_y
+                if primary <= abs(dx * dir_y - dy * dir_x):
+                    continue
+                dist = np.sqrt(dx * dx + dy * dy)
+                score = primary / dist * 10.0 - dist
+                if not found or score > best_score:
+                    found = True
+                    best_score = score
+                    best[k] = j
 
-        delta = f2d - a2d
-        dist = delta.length
-        if dist == 0:
-            continue
+    return kernel
 
-        delta_vec = Vector((delta.x, delta.y))
-        delta_vec.normalize()
 
-        dot = delta_vec.dot(dir_vec)
+# Scorers for the gesture directions, specialized once at import
+SCORERS = {direction: make_scorer(direction) for direction in GESTURE_DIRECTIONS}
+if HAS_NUMBA:
+    KERNELS = {direction: make_kernel(direction) for direction in GESTURE_DIRECTIONS}
 
-        if dot <= COS_HALF_ANGLE:
-            continue
 
-        score = dot * 10.0 - dist
+def best_neighbors(sel, indptr, indices, x2d, y2d, valid, direction_vector):
+    """
+    For every origin index in sel, pick the best neighbor among its CSR run
+    indices[indptr[o]:indptr[o + 1]], using an angular cone around the
+    gesture direction. Works for both cardinal and diagonal directions.
 
-        if best_score is None or score > best_score:
-            best_score = score
-            best = nf
+    Returns an int32 array aligned with sel: the winning neighbor or -1.
+    Uses the Numba kernel when available, NumPy otherwise.
+    """
+    best = np.full(len(sel), -1, np.int32)
+    direction = tuple(direction_vector)
+    if unit_direction(direction) is None:
+        return best
+
+    if HAS_NUMBA:
+        kernel = KERNELS.get(direction)
+        if kernel is None:
+            kernel = make_kernel(direction)
+        kernel(sel, indptr, indices, x2d, y2d, valid, best)
+        return best
+
+    # Origins behind the view never move; keep them out of the expansion
+    live = np.flatnonzero(valid[sel])
+    live_sel = sel[live]
+
+    # Expand the CSR runs of the origins into flat (origin, neighbor) pairs
+    counts = indptr[live_sel + 1] - indptr[live_sel]
+    total = int(counts.sum())
+    if not total:
+        return best
+    seg_start = np.cumsum(counts) - counts
+    origins = np.repeat(live_sel, counts)
+    neighbors = indices[np.arange(total) + np.repeat(indptr[live_sel] - seg_start, counts)]
+
+    scorer = SCORERS.get(direction)
+    if scorer is None:
+        scorer = make_scorer(direction)
+
+    dx = x2d[neighbors] - x2d[origins]
+    dy = y2d[neighbors] - y2d[origins]
+    mask, score = scorer(dx, dy)
+    mask &= valid[neighbors]
+    score[~mask] = -np.inf
+
+    # Best score per origin; origins without neighbors have no segment
+    has = np.flatnonzero(counts)
+    seg_max = np.maximum.reduceat(score, seg_start[has])
+
+    # Winner: first candidate of each segment that reaches its maximum
+    seg_of_pair = np.repeat(np.arange(len(has)), counts[has])
+    hits = np.flatnonzero(mask & (score == seg_max[seg_of_pair]))
+    segs, first = np.unique(seg_of_pair[hits], return_index=True)
+    best[live[has[segs]]] = neighbors[hits[first]]
 
     return best
 
 
-def walk_faces(context, direction_vector):
+def walk_selection_masks(sel, best, count):
+    """
+    Return (origin_mask, final_mask) as bool arrays over count elements.
+    Origins that moved are replaced by their targets (best >= 0);
+    the others stay selected where they are.
+    """
+    moved = best >= 0
+    origin_mask = np.zeros(count, dtype=bool)
+    origin_mask[sel] = True
+
+    # (origin & ~moved) | target, written in place: clearing the moved
+    # origins before setting the targets keeps an origin that is also
+    # another origin's target selected
+    final_mask = origin_mask.copy()
+    final_mask[sel[moved]] = False
+    final_mask[best[moved]] = True
+    return origin_mask, final_mask
+
+
+def walk_vertices(context, direction_vector, region=None, rv3d=None, bm=None):
     obj = context.edit_object
     if not obj or obj.type != 'MESH':
         return {'CANCELLED'}
 
-    region, rv3d = get_view_region_rv3d(context)
-    if region is None:
-        return {'CANCELLED'}
+    if region is None or rv3d is None:
+        region, rv3d = get_view_region_rv3d(context)
+        if region is None:
+            return {'CANCELLED'}
 
     me = obj.data
-    bm = bmesh.from_edit_mesh(me)
-    mw = obj.matrix_world
-
-    selected_faces = [f for f in bm.faces if f.select]
-    if not selected_faces:
+    if bm is None:
+        bm = bmesh.from_edit_mesh(me)
+
+    # Selected vertex indices, read in one go
+    bm.verts.index_update()
+    bm.verts.ensure_lookup_table()
+    entry = walk_cache_entry(obj, bm)
+    sel = np.flatnonzero(read_walk_selection(entry, obj)[0]).astype(np.int32)
+    if not len(sel):
         return {'CANCELLED'}
 
     active = bm.select_history.active
-    if not isinstance(active, bmesh.types.BMFace) or not active.select:
-        active = selected_faces[0]
+    if type(active) is not BMVERT or not active.select:
+        active = bm.verts[int(sel[0])]
+
+    # Project every vertex once; scoring is then pure array work.
+    # Repeated walks in the same view reuse projection and adjacency.
+    view = view_params(region, rv3d)
+    key = view_key(obj, view)
+    if entry.get("vert_view") != key:
+        world = cached_world_coords(entry, obj)
+        entry["vert_proj"] = project_to_region(world, view)
+        entry["vert_view"] = key
+    if "vert_adj" not in entry:
+        entry["vert_adj"] = vertex_adjacency(me)
+    x2d, y2d, valid = entry["vert_proj"]
+    indptr, indices = entry["vert_adj"]
+
+    # First compute targets for ALL selected verts without changing selection
+    best = best_neighbors(sel, indptr, indices, x2d, y2d, valid, direction_vector)
+
+    # Nothing can move: selection and active stay as they are, so skip
+    # the BMesh write-back and update_edit_mesh. obj.data was synced by
+    # the selection read; that update is already marked as the walk's own.
+    if not (best >= 0).any():
+        return {'CANCELLED'}
 
-    origin_set = set(selected_faces)
-    moved_origins = set()
-    target_faces = set()
-    active_target = None
+    origin_mask, final_mask = walk_selection_masks(sel, best, len(bm.verts))
 
-    for f in origin_set:
-        target = walk_single_face(f, bm, mw, region, rv3d, direction_vector)
-        if target:
-            target_faces.add(target)
-            moved_origins.add(f)
-            if f is active:
-                active_target = target
+    # Determine new active
+    active_target = best[sel == active.index]
+    if active_target[0] >= 0:
+        new_active = bm.verts[int(active_target[0])]
+    else:
+        # If active didn't move, keep it active
+        new_active = active
+
+    # Only touch verts whose state changes, then flush once so
+    # edges/faces follow the new vertex selection
+    added = np.flatnonzero(final_mask & ~origin_mask).tolist()
+    for i in np.flatnonzero(origin_mask & ~final_mask).tolist():
+        bm.verts[i].select_set(False)
+    for i in added:
+        bm.verts[i].select_set(True)
+    bm.select_flush(False)
+    if 'FACE' in bm.select_mode:
+        # Vertex+face mode: selecting faces here would make the next walk
+        # a mixed vertex/face selection, so only edges follow the verts
+        for i in added:
+            v = bm.verts[i]
+            for e in v.link_edges:
+                if e.other_vert(v).select:
+                    e.select_set(True)
+    else:
+        bm.select_flush(True)
+
+    bm.select_history.clear()
+    new_active.select_set(True)
+    bm.select_history.add(new_active)
+
+    bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
+    return {'FINISHED'}
+
+
+# ============================================================
+# Per-element walking: faces
+# ============================================================
+
+def walk_faces(context, direction_vector, region=None, rv3d=None, bm=None):
+    obj = context.edit_object
+    if not obj or obj.type != 'MESH':
+        return {'CANCELLED'}
 
-    final_selection = set(origin_set - moved_origins) | target_faces
+    if region is None or rv3d is None:
+        region, rv3d = get_view_region_rv3d(context)
+        if region is None:
+            return {'CANCELLED'}
 
-    if not final_selection:
+    me = obj.data
+    if bm is None:
+        bm = bmesh.from_edit_mesh(me)
+
+    # Selected face indices, read in one go
+    bm.faces.index_update()
+    bm.faces.ensure_lookup_table()
+    entry = walk_cache_entry(obj, bm)
+    sel = np.flatnonzero(read_walk_selection(entry, obj)[1]).astype(np.int32)
+    if not len(sel):
+        return {'CANCELLED'}
+
+    active = bm.select_history.active
+    if type(active) is not BMFACE or not active.select:
+        active = bm.faces[int(sel[0])]
+
+    # Project every face center once; scoring is then pure array work.
+    # Repeated walks in the same view reuse projection and adjacency.
+    view = view_params(region, rv3d)
+    key = view_key(obj, view)
+    if entry.get("face_view") != key:
+        centers = cached_face_centers(entry, obj)
+        entry["face_proj"] = project_to_region(centers, view)
+        entry["face_view"] = key
+    if "face_adj" not in entry:
+        entry["face_adj"] = face_adjacency(me)
+    x2d, y2d, valid = entry["face_proj"]
+    indptr, indices = entry["face_adj"]
+
+    best = best_neighbors(sel, indptr, indices, x2d, y2d, valid, direction_vector)
+
+    # Nothing can move: selection and active stay as they are, so skip
+    # the BMesh write-back and update_edit_mesh. obj.data was synced by
+    # the selection read; that update is already marked as the walk's own.
+    if not (best >= 0).any():
         return {'CANCELLED'}
 
-    if active_target:
-        new_active = active_target
+    origin_mask, final_mask = walk_selection_masks(sel, best, len(bm.faces))
+
+    active_target = best[sel == active.index]
+    if active_target[0] >= 0:
+        new_active = bm.faces[int(active_target[0])]
     else:
         new_active = active
 
-    # Clear all selections (verts, edges, faces)
-    for v in bm.verts:
-        v.select_set(False)
-    for e in bm.edges:
-        e.select_set(False)
-    for f in bm.faces:
-        f.select_set(False)
+    # Only touch faces whose state changes. In vertex+face mode,
+    # deselecting a face also drops verts/edges it shares with a face
+    # that stays, so there the kept faces are re-asserted as well.
+    for i in np.flatnonzero(origin_mask & ~final_mask).tolist():
+        bm.faces[i].select_set(False)
+    if 'VERT' in bm.select_mode:
+        to_select = final_mask
+    else:
+        to_select = final_mask & ~origin_mask
+    for i in np.flatnonzero(to_select).tolist():
+        bm.faces[i].select_set(True)
 
-    # Apply face selection
-    for f in final_selection:
-        f.select_set(True)
+    # Let verts/edges follow the faces per the active select mode
+    # (a no-op in pure face mode)
+    bm.select_flush_mode()
 
     bm.select_history.clear()
     new_active.select_set(True)
@@ -288,13 +649,14 @@ def walk_faces(context, direction_vector):
 # Dispatcher (MIX2 rule preserved)
 # ============================================================
 
-def walk_dispatch(op, context, direction_vector):
+def walk_dispatch(op, context, direction_vector, region=None, rv3d=None):
     obj = context.edit_object
     if not obj or obj.type != 'MESH':
         op.report({'WARNING'}, "No mesh in Edit Mode.")
         return {'CANCELLED'}
 
     me = obj.data
+    # One BMesh wrapper per walk, shared with the walkers
     bm = bmesh.from_edit_mesh(me)
 
     vert_mode, edge_mode, face_mode = context.tool_settings.mesh_select_mode
@@ -303,23 +665,24 @@ def walk_dispatch(op, context, direction_vector):
         op.report({'WARNING'}, "Edge walking is not supported by Screen-Based Walker.")
         return {'CANCELLED'}
 
-    # Read the raw selection once
-    selected_verts = [v for v in bm.verts if v.select]
-    selected_faces = [f for f in bm.faces if f.select]
+    # Only emptiness matters here: the edit-mesh selection counters
+    # answer that without a sync; the walker reads the selection itself
+    selected_verts = me.total_vert_sel > 0
+    selected_faces = me.total_face_sel > 0
 
     # 1) Pure vertex mode: ignore face selection
     if vert_mode and not face_mode:
         if not selected_verts:
             op.report({'WARNING'}, "No vertices selected.")
             return {'CANCELLED'}
-        return walk_vertices(context, direction_vector)
+        return walk_vertices(context, direction_vector, region, rv3d, bm)
 
     # 2) Pure face mode: ignore vertex selection
     if face_mode and not vert_mode:
         if not selected_faces:
             op.report({'WARNING'}, "No faces selected.")
             return {'CANCELLED'}
-        return walk_faces(context, direction_vector)
+        return walk_faces(context, direction_vector, region, rv3d, bm)
 
     # 3) Both vertex and face mode enabled (MIX2 rule)
     if vert_mode and face_mode:
@@ -332,10 +695,10 @@ def walk_dispatch(op, context, direction_vector):
             return {'CANCELLED'}
 
         if selected_verts:
-            return walk_vertices(context, direction_vector)
+            return walk_vertices(context, direction_vector, region, rv3d, bm)
 
         if selected_faces:
-            return walk_faces(context, direction_vector)
+            return walk_faces(context, direction_vector, region, rv3d, bm)
 
         op.report({'WARNING'}, "Nothing selected.")
         return {'CANCELLED'}
@@ -370,33 +733,19 @@ class VWALK_OT_gesture(bpy.types.Operator):
             if abs(dx) < 6 and abs(dy) < 6:
                 return {'CANCELLED'}
 
-            import math
             angle = math.atan2(dy, dx)  # radians, screen space
 
-            # Define the 8 directions with their angles
-            # (vector, angle in radians)
-            directions = [
-                ((1, 0),        0),                     # East
-                ((1, 1),        math.pi / 4),           # NE
-                ((0, 1),        math.pi / 2),           # North
-                ((-1, 1),       3 * math.pi / 4),       # NW
-                ((-1, 0),       math.pi),               # West
-                ((-1, -1),     -3 * math.pi / 4),       # SW
-                ((0, -1),      -math.pi / 2),           # South
-                ((1, -1),      -math.pi / 4),           # SE
-            ]
-
             # Pick the direction whose angle is closest to the gesture angle
             best_vec = None
             best_score = None
-            for vec, ang in directions:
+            for vec, ang in zip(GESTURE_DIRECTIONS, GESTURE_ANGLES):
                 diff = abs((angle - ang + math.pi) % (2 * math.pi) - math.pi)
                 score = -diff  # smaller angle difference = better
                 if best_score is None or score > best_score:
                     best_score = score
                     best_vec = vec
 
-            return walk_dispatch(self, context, best_vec)
+            return walk_dispatch(self, context, best_vec, self._region, self._rv3d)
 
         return {'RUNNING_MODAL'}
 
@@ -407,6 +756,10 @@ class VWALK_OT_gesture(bpy.types.Operator):
 
         if event.type == 'MIDDLEMOUSE' and event.ctrl:
             self.start_mouse = (event.mouse_region_x, event.mouse_region_y)
+            # The gesture happens in this region; remember it instead of
+            # scanning the screen for a 3D view on every walk
+            self._rv3d = context.region_data
+            self._region = context.region if self._rv3d else None
             context.window_manager.modal_handler_add(self)
             return {'RUNNING_MODAL'}
 
@@ -456,9 +809,14 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     register_keymaps()
+    bpy.app.handlers.depsgraph_update_post.append(walk_cache_depsgraph_update)
+    bpy.app.handlers.load_post.append(walk_cache_load_post)
 
 
 def unregister():
+    bpy.app.handlers.load_post.remove(walk_cache_load_post)
+    bpy.app.handlers.depsgraph_update_post.remove(walk_cache_depsgraph_update)
+    walk_cache.clear()
     unregister_keymaps()
     for cls in classes:
         bpy.utils.unregister_class(cls)